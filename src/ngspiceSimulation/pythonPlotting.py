@@ -2,14 +2,81 @@ from __future__ import division  # Used for decimal division
 # eg: 2/3=0.66 and not '0' 6/2=3.0 and 6//2=3
 import os
 from PyQt5 import QtGui, QtCore, QtWidgets
-from decimal import Decimal, getcontext
-from matplotlib.backends.backend_qt5agg\
-    import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg\
-    import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
 from configuration.Appconfig import Appconfig
-import numpy as np
+
+# matplotlib and numpy are only imported once they are needed, see
+# loadPlottingModules(), as importing them at eSim start-up is slow.
+np = Figure = FigureCanvas = NavigationToolbar = None
+
+# Stylesheet of the colour chip shown next to each node/branch
+COLOR_STYLES = {
+    'r': 'color:red',
+    'b': 'color:blue',
+    'g': 'color:green',
+    'y': 'color:yellow',
+    'c': 'color:cyan',
+    'm': 'color:magenta',
+    'k': 'color:black'
+}
+
+
+def loadPlottingModules():
+    global np, Figure, FigureCanvas, NavigationToolbar
+    if np is not None:
+        return
+    from matplotlib.backends.backend_qt5agg\
+        import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qt5agg\
+        import NavigationToolbar2QT as NavigationToolbar
+    from matplotlib.figure import Figure
+    import matplotlib
+    # Drop vertices closer than a pixel from the drawn path and render
+    # long paths in chunks, which keeps redraws of dense traces fast
+    # at the cost of sub-pixel detail.
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000
+    })
+    # Imported last, np doubles as the "already loaded" flag
+    import numpy as np
+
+
+def m4Decimate(x, y, bins, edges=None):
+    """
+    Reduce a trace to the first, minimum, maximum and last sample of
+    each of `bins` bins, in their original order. `edges` are the sample
+    indices splitting the trace into bins, by default bins of equal
+    sample count. With one bin per pixel column of the axes the drawn
+    line keeps every peak of the full trace, while the number of points
+    handed to the renderer no longer depends on the simulation length.
+    """
+    n = len(y)
+    if n <= 4 * bins:
+        return x, y
+    if edges is None:
+        # Bins differ by at most one sample, so none of them is
+        # stretched over a wider part of the trace than the others
+        edges = np.linspace(0, n, bins + 1).astype(int)
+    counts = np.diff(edges)
+    # Bins between two samples of a sparse stretch of x are empty
+    starts = edges[:-1][counts > 0]
+    counts = counts[counts > 0]
+    # Bin of every sample, to locate where each bin has its extremum
+    owner = np.repeat(np.arange(len(starts)), counts)
+    picks = [starts, starts + counts - 1]
+    for reduce in (np.minimum, np.maximum):
+        extremum = np.repeat(reduce.reduceat(y, starts), counts)
+        # Any sample equal to the extremum will do, a bin holding NaN
+        # has none and keeps its first sample
+        hit = np.flatnonzero(y == extremum)
+        idx = starts.copy()
+        idx[owner[hit]] = hit
+        picks.append(idx)
+    idx = np.sort(np.stack(picks, axis=1), axis=1).ravel()
+    # Bins of fewer than four samples would repeat some of them
+    idx = idx[np.append(True, np.diff(idx) > 0)]
+    return x[idx], y[idx]
 
 
 # This class creates Python Plotting window
@@ -22,6 +89,7 @@ class plotWindow(QtWidgets.QMainWindow):
     def __init__(self, fpath, projectName):
         """This create constructor for plotWindow class."""
         QtWidgets.QMainWindow.__init__(self)
+        loadPlottingModules()
         self.fpath = fpath
         self.projectName = projectName
         self.obj_appconfig = Appconfig()
@@ -31,9 +99,8 @@ class plotWindow(QtWidgets.QMainWindow):
             'Ngspice simulation is called : ' + self.fpath)
         self.obj_appconfig.print_info(
             'PythonPlotting is called : ' + self.fpath)
-        self.combo = []
-        self.combo1 = []
-        self.combo1_rev = []
+        # Compiled function expressions, see pushedPlotFunc()
+        self.exprCache = {}
         # Creating Frame
         self.createMainFrame()
 
@@ -45,6 +112,8 @@ class plotWindow(QtWidgets.QMainWindow):
         self.canvas = FigureCanvas(self.fig)
         self.canvas.setParent(self.mainFrame)
         self.axes = self.fig.add_subplot(111)
+        self.clearAxes()
+        self.canvas.mpl_connect('resize_event', self.onCanvasResize)
         self.navToolBar = NavigationToolbar(self.canvas, self.mainFrame)
 
         # LeftVbox hold navigation tool bar and canvas
@@ -64,28 +133,20 @@ class plotWindow(QtWidgets.QMainWindow):
 
         self.obj_dataext.computeAxes()
         self.a = self.obj_dataext.numVals()
+        # Index of every node/branch name, for parsing plot functions
+        self.nodeIndex = {}
+        for i, name in enumerate(self.obj_dataext.NBList):
+            self.nodeIndex.setdefault(name, i)
 
         self.chkbox = []
 
         # Generating list of colors :
         # ,(0.4,0.5,0.2),(0.1,0.4,0.9),(0.4,0.9,0.2),(0.9,0.4,0.9)]
         self.full_colors = ['r', 'b', 'g', 'y', 'c', 'm', 'k']
-        self.color = []
-        for i in range(0, self.a[0] - 1):
-            if i % 7 == 0:
-                self.color.append(self.full_colors[0])
-            elif (i - 1) % 7 == 0:
-                self.color.append(self.full_colors[1])
-            elif (i - 2) % 7 == 0:
-                self.color.append(self.full_colors[2])
-            elif (i - 3) % 7 == 0:
-                self.color.append(self.full_colors[3])
-            elif (i - 4) % 7 == 0:
-                self.color.append(self.full_colors[4])
-            elif (i - 5) % 7 == 0:
-                self.color.append(self.full_colors[5])
-            elif (i - 6) % 7 == 0:
-                self.color.append(self.full_colors[6])
+        self.color = [
+            self.full_colors[i % len(self.full_colors)]
+            for i in range(self.a[0] - 1)
+        ]
 
         # Color generation ends here
 
@@ -99,7 +160,6 @@ class plotWindow(QtWidgets.QMainWindow):
         self.top_grid.addWidget(self.listBranch, self.a[1] + 2, 0)
         for i in range(0, self.a[1]):  # a[0]-1
             self.chkbox.append(QtWidgets.QCheckBox(self.obj_dataext.NBList[i]))
-            self.chkbox[i].setStyleSheet('color')
             self.chkbox[i].setToolTip('<b>Check To Plot</b>')
             self.top_grid.addWidget(self.chkbox[i], i + 2, 0)
             self.colorLab = QtWidgets.QLabel()
@@ -213,24 +273,160 @@ class plotWindow(QtWidgets.QMainWindow):
 
         self.setCentralWidget(self.mainFrame)
 
+    def clearAxes(self):
+        self.axes.cla()
+        # Full resolution data of every decimated line on the axes, and
+        # the x-limits and bin count they were last decimated for
+        self.traceData = {}
+        self.decimatedView = None
+        # Per x array: whether it is sorted, and the bin edges of the
+        # whole sweep, shared by every trace plotted against it
+        self.sortedSweeps = {}
+        self.sweepEdges = {}
+        # Node/branch lines kept for reuse by showTraces()
+        self.traceLines = {}
+        self.tracePlotter = None
+        # cla() resets the axes callbacks
+        self.axes.callbacks.connect('xlim_changed', self.onXlimChanged)
+
+    def showTraces(self, plotter, checked):
+        """
+        Show the checked node/branch traces. Lines drawn by an earlier
+        press of 'Plot' are reused and only hidden when unchecked, so
+        the axes are not rebuilt every time the selection changes.
+        """
+        if plotter != self.tracePlotter:
+            self.clearAxes()
+            self.tracePlotter = plotter
+        for line in self.traceLines.values():
+            line.set_visible(False)
+        for j in checked:
+            line = self.traceLines.get(j)
+            if line is None:
+                self.traceLines[j] = self.plotTrace(
+                    plotter,
+                    self.obj_dataext.x,
+                    self.obj_dataext.y[j],
+                    c=self.color[j],
+                    label=str(j + 1))
+            else:
+                # Hidden lines are not kept up to date on zoom, and the
+                # limits are recomputed from the full trace below.
+                x, y = self.traceData[line]
+                bins = self.decimationBins()
+                line.set_data(
+                    *m4Decimate(x, y, bins, self.sweepBins(x, bins)))
+                line.set_visible(True)
+        self.decimatedView = None
+        self.axes.relim(visible_only=True)
+        self.axes.autoscale()
+
+    def plotTrace(self, plotter, x, y, **kwargs):
+        """
+        Plot a trace through `plotter` (e.g. self.axes.plot), decimated
+        to one bin per pixel column of the axes. The full data is kept so
+        that the line can be recomputed for the visible range whenever
+        the x-limits or the canvas size change.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        bins = self.decimationBins()
+        line, = plotter(
+            *m4Decimate(x, y, bins, self.sweepBins(x, bins)), **kwargs)
+        self.traceData[line] = (x, y)
+        self.decimatedView = None
+        return line
+
+    def onXlimChanged(self, axes):
+        xmin, xmax = sorted(axes.get_xlim())
+        bins = self.decimationBins()
+        # set_xlim() notifies even when the limits did not change, and a
+        # resize that keeps the width of the axes needs no new bins
+        if (xmin, xmax, bins) == self.decimatedView:
+            return
+        self.decimatedView = (xmin, xmax, bins)
+        ranges = {}
+        for line, (x, y) in self.traceData.items():
+            if not line.get_visible():
+                continue
+            # Traces normally share one x array, only search it once
+            if id(x) not in ranges:
+                start, stop = self.visibleRange(x, xmin, xmax)
+                edges = None
+                if self.isSorted(x):
+                    edges = self.binEdges(x[start:stop], bins, xmin, xmax)
+                ranges[id(x)] = (start, stop, edges)
+            start, stop, edges = ranges[id(x)]
+            line.set_data(
+                *m4Decimate(x[start:stop], y[start:stop], bins, edges))
+
+    def onCanvasResize(self, event):
+        # The number of bins follows the width of the axes
+        self.onXlimChanged(self.axes)
+
+    def decimationBins(self):
+        # One bin per pixel column of the axes
+        return max(int(self.axes.bbox.width), 1)
+
+    def binEdges(self, x, bins, xmin=None, xmax=None):
+        """
+        Sample indices splitting x into `bins` bins of equal width on the
+        x axis, by default between its first and last value. Widths are
+        measured in the coordinates of the axis, so that on a log axis
+        each bin still covers one pixel column. x must be sorted, see
+        isSorted(); sweeps that are not get bins of equal sample count.
+        """
+        if len(x) <= 4 * bins:
+            return None
+        if xmin is None:
+            xmin, xmax = x[0], x[-1]
+        scale = self.axes.xaxis.get_transform()
+        lo, hi = scale.transform(np.array([xmin, xmax], dtype=float))
+        if not lo < hi:
+            return None
+        edges = np.searchsorted(
+            x, scale.inverted().transform(np.linspace(lo, hi, bins + 1)))
+        # Samples just outside the limits belong to the outer bins
+        edges[0], edges[-1] = 0, len(x)
+        return edges
+
+    def sweepBins(self, x, bins):
+        # Bin edges of a whole sweep, computed once for all its traces
+        key = (id(x), bins, self.axes.get_xscale())
+        if key not in self.sweepEdges:
+            self.sweepEdges[key] = (
+                self.binEdges(x, bins) if self.isSorted(x) else None)
+        return self.sweepEdges[key]
+
+    def isSorted(self, x):
+        # Clip to view and binning by x width need an ascending sweep,
+        # a nested DC sweep repeats its x range and is not one. Keyed by
+        # id(), as x is kept alive by self.traceData.
+        if id(x) not in self.sortedSweeps:
+            self.sortedSweeps[id(x)] = not np.any(np.diff(x) < 0)
+        return self.sortedSweeps[id(x)]
+
+    def visibleRange(self, x, xmin, xmax):
+        start, stop = 0, len(x)
+        # Unsorted sweeps are drawn in full
+        if stop > 1 and self.isSorted(x):
+            # Keep one sample either side so the line reaches the edges
+            start = max(np.searchsorted(x, xmin, 'left') - 1, 0)
+            stop = min(np.searchsorted(x, xmax, 'right') + 1, stop)
+        return start, stop
+
     # definition of functions pushedClear, pushedPlotFunc.
     def pushedClear(self):
         self.text.clear()
-        self.axes.cla()
-        self.canvas.draw()
+        self.clearAxes()
+        self.canvas.draw_idle()
 
     def pushedPlotFunc(self):
-        self.parts = str(self.text.text())
-        self.parts = self.parts.split(" ")
-
-        if self.parts[len(self.parts) - 1] == '':
-            self.parts = self.parts[0:-1]
+        # Operands and operators, separated by any amount of whitespace
+        self.parts = str(self.text.text()).split()
 
-        self.values = self.parts
         self.comboAll = []
-        self.axes.cla()
-
-        self.plotType2 = self.obj_dataext.openFile(self.fpath)
+        self.clearAxes()
 
         if len(self.parts) <= 2:
             self.warnning.setText("Too few arguments!\nRefer syntax below!")
@@ -241,15 +437,10 @@ class plotWindow(QtWidgets.QMainWindow):
         else:
             self.warnning.setText("")
 
-        a = []
-        finalResult = []
-        # p = 0
-
-        for i in range(len(self.parts)):
-            if i % 2 == 0:
-                for j in range(len(self.obj_dataext.NBList)):
-                    if self.parts[i] == self.obj_dataext.NBList[j]:
-                        a.append(j)
+        a = [
+            self.nodeIndex[part] for part in self.parts[::2]
+            if part in self.nodeIndex
+        ]
 
         if len(a) != len(self.parts) // 2 + 1:
             QtWidgets.QMessageBox.about(
@@ -283,15 +474,9 @@ class plotWindow(QtWidgets.QMainWindow):
                 )
                 return
             else:
-                self.axes.cla()
-
-                for i in range(len(self.obj_dataext.y[a[0]])):
-                    self.combo.append(self.obj_dataext.y[a[0]][i])
-                    self.combo1.append(self.obj_dataext.y[a[1]][i])
-
                 self.axes.plot(
-                    self.combo,
-                    self.combo1,
+                    self.comboAll[0],
+                    self.comboAll[1],
                     c=self.color[1],
                     label=str(2))  # _rev
 
@@ -309,229 +494,133 @@ class plotWindow(QtWidgets.QMainWindow):
             return
 
         else:
-            for j in range(len(self.comboAll[0])):
-                for i in range(len(self.values)):
-                    if i % 2 == 0:
-                        self.values[i] = str(self.comboAll[i // 2][j])
-                        re = " ".join(self.values[:])
-                try:
-                    finalResult.append(eval(re))
-                except ArithmeticError:
-                    QtWidgets.QMessageBox.about(
-                        self, "Warning!!", "Dividing by zero!!"
-                    )
-                    return
-
-            if self.plotType2[0] == 0:
-                # self.setWindowTitle('AC Analysis')
-                if self.plotType2[1] == 1:
-                    self.axes.semilogx(
-                        self.obj_dataext.x,
-                        finalResult,
-                        c=self.color[0],
-                        label=str(1))
-                else:
-                    self.axes.plot(
-                        self.obj_dataext.x,
-                        finalResult,
-                        c=self.color[0],
-                        label=str(1))
-
-                self.axes.set_xlabel('freq-->')
+            # Evaluate the expression once over the whole traces, with the
+            # operands replaced by placeholders bound to their data.
+            expression = " ".join(
+                "_t%d" % (i // 2) if i % 2 == 0 else self.parts[i]
+                for i in range(len(self.parts)))
+            code = self.exprCache.get(expression)
+            if code is None:
+                code = compile(expression, '<function>', 'eval')
+                self.exprCache[expression] = code
+            operands = {
+                "_t%d" % i: trace for i, trace in enumerate(self.comboAll)}
+            try:
+                with np.errstate(divide='raise', invalid='raise'):
+                    finalResult = eval(code, {'__builtins__': {}}, operands)
+            except ArithmeticError:
+                QtWidgets.QMessageBox.about(
+                    self, "Warning!!", "Dividing by zero!!"
+                )
+                return
 
-                if max(a) < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
+            if self.plotType[0] == 0:
+                # self.setWindowTitle('AC Analysis')
+                if self.plotType[1] == 1:
+                    plotter = self.axes.semilogx
                 else:
-                    self.axes.set_ylabel('Current(I)-->')
-
-            elif self.plotType2[0] == 1:
+                    plotter = self.axes.plot
+                xlabel = 'freq-->'
+            elif self.plotType[0] == 1:
                 # self.setWindowTitle('Transient Analysis')
-                self.axes.plot(
-                    self.obj_dataext.x,
-                    finalResult,
-                    c=self.color[0],
-                    label=str(1))
-                self.axes.set_xlabel('time-->')
-                if max(a) < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
-
+                plotter = self.axes.plot
+                xlabel = 'time-->'
             else:
                 # self.setWindowTitle('DC Analysis')
-                self.axes.plot(
-                    self.obj_dataext.x,
-                    finalResult,
-                    c=self.color[0],
-                    label=str(1))
-                self.axes.set_xlabel('I/P Voltage-->')
-                if max(a) < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
+                plotter = self.axes.plot
+                xlabel = 'I/P Voltage-->'
+
+            self.plotTrace(
+                plotter,
+                self.obj_dataext.x,
+                finalResult,
+                c=self.color[0],
+                label=str(1))
+            self.axes.set_xlabel(xlabel)
+            if max(a) < self.volts_length:
+                self.axes.set_ylabel('Voltage(V)-->')
+            else:
+                self.axes.set_ylabel('Current(I)-->')
 
         self.axes.grid(True)
-        self.canvas.draw()
-        self.combo = []
-        self.combo1 = []
-        self.combo1_rev = []
+        self.canvas.draw_idle()
 
-    # definition of functions onPush_decade, onPush_ac, onPush_trans,\
-    # onPush_dc, color and multimeter and getRMSValue.
-    def onPush_decade(self):
-        boxCheck = 0
-        self.axes.cla()
+    def checkedTraces(self):
+        """Return the indices of the nodes/branches ticked for plotting."""
+        return [i for i, box in enumerate(self.chkbox) if box.isChecked()]
 
-        for i, j in zip(self.chkbox, list(range(len(self.chkbox)))):
-            if i.isChecked():
-                boxCheck += 1
-                self.axes.semilogx(
-                    self.obj_dataext.x,
-                    self.obj_dataext.y[j],
-                    c=self.color[j],
-                    label=str(
-                        j + 1))
-                self.axes.set_xlabel('freq-->')
-                if j < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
-
-                self.axes.grid(True)
-        if boxCheck == 0:
+    def plotChecked(self, plotter, xlabel):
+        checked = self.checkedTraces()
+        self.showTraces(plotter, checked)
+        if not checked:
             QtWidgets.QMessageBox.about(
                 self, "Warning!!", "Please select at least one Node OR Branch"
             )
             return
 
-        self.canvas.draw()
+        self.axes.set_xlabel(xlabel)
+        # The y-axis is labelled after the last checked trace
+        if checked[-1] < self.volts_length:
+            self.axes.set_ylabel('Voltage(V)-->')
+        else:
+            self.axes.set_ylabel('Current(I)-->')
+        self.axes.grid(True)
+        self.canvas.draw_idle()
 
-    def onPush_ac(self):
-        self.axes.cla()
-        boxCheck = 0
-        for i, j in zip(self.chkbox, list(range(len(self.chkbox)))):
-            if i.isChecked():
-                boxCheck += 1
-                self.axes.plot(
-                    self.obj_dataext.x,
-                    self.obj_dataext.y[j],
-                    c=self.color[j],
-                    label=str(
-                        j + 1))
-                self.axes.set_xlabel('freq-->')
-                if j < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
-                self.axes.grid(True)
-        if boxCheck == 0:
-            QtWidgets.QMessageBox.about(
-                self, "Warning!!", "Please select at least one Node OR Branch"
-            )
-            return
+    # definition of functions onPush_decade, onPush_ac, onPush_trans,\
+    # onPush_dc, color and multimeter and getRMSValue.
+    def onPush_decade(self):
+        self.plotChecked(self.axes.semilogx, 'freq-->')
 
-        self.canvas.draw()
+    def onPush_ac(self):
+        self.plotChecked(self.axes.plot, 'freq-->')
 
     def onPush_trans(self):
-        self.axes.cla()
-        boxCheck = 0
-        for i, j in zip(self.chkbox, list(range(len(self.chkbox)))):
-            if i.isChecked():
-                boxCheck += 1
-                self.axes.plot(
-                    self.obj_dataext.x,
-                    self.obj_dataext.y[j],
-                    c=self.color[j],
-                    label=str(
-                        j + 1))
-                self.axes.set_xlabel('time-->')
-                if j < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
-                self.axes.grid(True)
-        if boxCheck == 0:
-            QtWidgets.QMessageBox.about(
-                self, "Warning!!", "Please select at least one Node OR Branch"
-            )
-            return
-        self.canvas.draw()
+        self.plotChecked(self.axes.plot, 'time-->')
 
     def onPush_dc(self):
-        boxCheck = 0
-        self.axes.cla()
-        for i, j in zip(self.chkbox, list(range(len(self.chkbox)))):
-            if i.isChecked():
-                boxCheck += 1
-                self.axes.plot(
-                    self.obj_dataext.x,
-                    self.obj_dataext.y[j],
-                    c=self.color[j],
-                    label=str(
-                        j + 1))
-                self.axes.set_xlabel('Voltage Sweep(V)-->')
-
-                if j < self.volts_length:
-                    self.axes.set_ylabel('Voltage(V)-->')
-                else:
-                    self.axes.set_ylabel('Current(I)-->')
-                self.axes.grid(True)
-        if boxCheck == 0:
-            QtWidgets.QMessageBox.about(
-                self, "Warning!!", "Please select atleast one Node OR Branch"
-            )
-            return
-
-        self.canvas.draw()
+        self.plotChecked(self.axes.plot, 'Voltage Sweep(V)-->')
 
     def colorName(self, letter):
-        return {
-            'r': 'color:red',
-            'b': 'color:blue',
-            'g': 'color:green',
-            'y': 'color:yellow',
-            'c': 'color:cyan',
-            'm': 'color:magenta',
-            'k': 'color:black'
-        }[letter]
+        return COLOR_STYLES[letter]
 
     def multiMeter(self):
         print("Function : MultiMeter")
         self.obj = {}
-        boxCheck = 0
+        checked = self.checkedTraces()
         loc_x = 300
         loc_y = 300
 
-        for i, j in zip(self.chkbox, list(range(len(self.chkbox)))):
-            if i.isChecked():
-                print("Check box", self.obj_dataext.NBList[j])
-                boxCheck += 1
-                if self.obj_dataext.NBList[j] in self.obj_dataext.NBIList:
-                    voltFlag = False
-                else:
-                    voltFlag = True
-                # Initializing Multimeter
-                self.obj[j] = MultimeterWidgetClass(
-                    self.obj_dataext.NBList[j], self.getRMSValue(
-                        self.obj_dataext.y[j]), loc_x, loc_y, voltFlag)
-                loc_x += 50
-                loc_y += 50
-                # Adding object of multimeter to dictionary
-                (
-                    self.obj_appconfig.
-                    dock_dict[
-                        self.obj_appconfig.current_project['ProjectName']].
-                    append(self.obj[j])
-                )
+        for j in checked:
+            print("Check box", self.obj_dataext.NBList[j])
+            if self.obj_dataext.NBList[j] in self.obj_dataext.NBIList:
+                voltFlag = False
+            else:
+                voltFlag = True
+            # Initializing Multimeter
+            self.obj[j] = MultimeterWidgetClass(
+                self.obj_dataext.NBList[j], self.getRMSValue(
+                    self.obj_dataext.y[j]), loc_x, loc_y, voltFlag)
+            loc_x += 50
+            loc_y += 50
+            # Adding object of multimeter to dictionary
+            (
+                self.obj_appconfig.
+                dock_dict[
+                    self.obj_appconfig.current_project['ProjectName']].
+                append(self.obj[j])
+            )
 
-        if boxCheck == 0:
+        if not checked:
             QtWidgets.QMessageBox.about(
                 self, "Warning!!", "Please select at least one Node OR Branch"
             )
 
     def getRMSValue(self, dataPoints):
-        getcontext().prec = 5
-        return np.sqrt(np.mean(np.square(dataPoints)))
+        dataPoints = np.asarray(dataPoints, dtype=float)
+        # Sum of squares as a dot product, without a squared temporary
+        return float(
+            np.sqrt(np.dot(dataPoints, dataPoints) / len(dataPoints)))
 
 
 class MultimeterWidgetClass(QtWidgets.QWidget):
@@ -541,10 +630,10 @@ class MultimeterWidgetClass(QtWidgets.QWidget):
         self.multimeter = QtWidgets.QWidget(self)
         if voltFlag:
             self.node_branchLabel = QtWidgets.QLabel("Node")
-            self.rmsValue = QtWidgets.QLabel(str(rmsValue) + " Volts")
+            self.rmsValue = QtWidgets.QLabel('%.5g Volts' % rmsValue)
         else:
             self.node_branchLabel = QtWidgets.QLabel("Branch")
-            self.rmsValue = QtWidgets.QLabel(str(rmsValue) + " Amp")
+            self.rmsValue = QtWidgets.QLabel('%.5g Amp' % rmsValue)
 
         self.rmsLabel = QtWidgets.QLabel("RMS Value")
         self.nodeBranchValue = QtWidgets.QLabel(str(node_branch))
@@ -565,6 +654,7 @@ class MultimeterWidgetClass(QtWidgets.QWidget):
 
 class DataExtraction:
     def __init__(self):
+        loadPlottingModules()
         self.obj_appconfig = Appconfig()
         self.data = []
         # consists of all the columns of data belonging to nodes and branches
@@ -796,15 +886,8 @@ class DataExtraction:
         return [b, a]
 
     def computeAxes(self):
-        nums = len(self.data[0].split("\t"))
-        self.y = []
-        var = self.data[0].split("\t")
-        for i in range(1, nums):
-            self.y.append([Decimal(var[i])])
-        for i in self.data[1:]:
-            temp = i.split("\t")
-            for j in range(1, nums):
-                self.y[j - 1].append(Decimal(temp[j]))
-        for i in self.data:
-            temp = i.split("\t")
-            self.x.append(Decimal(temp[0]))
+        # One row per sample: x value followed by every node/branch value
+        table = np.array([i.split("\t") for i in self.data], dtype=float)
+        self.x = table[:, 0]
+        # One contiguous row per node/branch, so y[i] is a plain view
+        self.y = np.ascontiguousarray(table[:, 1:].T)